@@ -27,14 +27,52 @@ Components:
 # GitHub Usage Examples: https://github.com/JulianStiebler/secureRequests/wiki/6-%E2%80%90-Usage-Examples
 """
 
-from .secureRequestsConfig import config
-from .secureRequests import SecureRequests
-from .secureRequestsDecorators import handleResponse
-from .secureRequestsEnums import HeaderKeys, CookieKeys, CookieAttributeKeys
-from . import secureRequestsExceptions as srExceptions
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static type checkers do not follow the lazy `__getattr__`, give them the real names
+    from .secureRequestsConfig import config
+    from .secureRequests import SecureRequests
+    from .secureRequestsDecorators import handleResponse
+    from .secureRequestsEnums import HeaderKeys, CookieKeys, CookieAttributeKeys
+    from . import secureRequestsExceptions as srExceptions
+
+# Components are resolved on first attribute access (PEP 562), so importing the package
+# or a single lightweight component (e.g. the enums) does not pull in `requests` and the TLS machinery.
+_LAZY_COMPONENTS = {
+    'SecureRequests': ('.secureRequests', 'SecureRequests'),
+    'config': ('.secureRequestsConfig', 'config'),
+    'handleResponse': ('.secureRequestsDecorators', 'handleResponse'),
+    'HeaderKeys': ('.secureRequestsEnums', 'HeaderKeys'),
+    'CookieKeys': ('.secureRequestsEnums', 'CookieKeys'),
+    'CookieAttributeKeys': ('.secureRequestsEnums', 'CookieAttributeKeys'),
+    'srExceptions': ('.secureRequestsExceptions', None),
+}
 
 __all__ = [
     'SecureRequests', 'config', 'handleResponse',
     'srExceptions', 
     'CookieAttributeKeys', 'HeaderKeys', 'CookieKeys'
     ]
+
+def __getattr__(name):
+    """
+    Imports a package component on first access and caches it in the module namespace.
+
+    Raises
+    ------
+    AttributeError
+        If `name` is not a component of the package.
+    """
+    if name not in _LAZY_COMPONENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    moduleName, attributeName = _LAZY_COMPONENTS[name]
+    module = import_module(moduleName, __name__)
+    value = module if attributeName is None else getattr(module, attributeName)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Lists the lazily loaded components alongside the module attributes."""
+    return sorted(set(globals()) | set(_LAZY_COMPONENTS))
@@ -6,8 +6,8 @@ Classes:
 TLSAdapter: A custom Transport Adapter for using a specified SSL context with requests.
     Methods:
         - __init__: Initializes the TLSAdapter with an optional SSL context.
-        - initPoolmanager: Initializes the pool manager with the SSL context.
-        - _createSSLContext: Creates and returns a default SSL context.
+        - build_connection_pool_key_attributes: Adds the SSL context to verified HTTPS pool keys.
+        - _createSSLContext: Returns the shared default SSL context.
 
 SecureRequests: Provides methods to make HTTP requests with enhanced security features, including
                 SSL/TTLS configuration, certificate management, and custom headers and cookies.
@@ -16,6 +16,7 @@ SecureRequests: Provides methods to make HTTP requests with enhanced security fe
         - _certificateFetch: Fetches the SSL certificate if required.
         - _certificateSet: Sets the SSL certificate for the session.
         - makeRequest: Makes an HTTP request with the given method, URL, and optional payload and headers.
+        - makeRequests: Makes several HTTP requests concurrently over the shared session.
         - _logRequest: Logs the details of the HTTP request and response.
         - _logMessage: Logs a message with a specified level and [category].
         - headerGenerate: Generates a dictionary of default headers for HTTP requests.
@@ -60,6 +61,7 @@ Usage Examples
 # Last edited: 28.07.2024
 """
 
+import os
 from os.path import exists as PathExists
 from os.path import join as PathJoin
 import requests
@@ -67,14 +69,121 @@ import ssl
 import warnings
 import logging
 import random
+from itertools import product
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from http.cookiejar import Cookie
+from requests.cookies import create_cookie, remove_cookie_by_name
 from urllib3.exceptions import InsecureRequestWarning
 from hashlib import sha256
+import hmac
 
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from .secureRequestsConfig import config
 from .secureRequestsDecorators import handleResponse
-from .secureRequestsEnums import HeaderKeys, CookieKeys, CookieAttributeKeys
+from .secureRequestsEnums import HeaderKeys, CookieKeys, CookieAttributeKeys, HEADER_KEY_VALUES, COOKIE_KEY_VALUES, COOKIE_KEY_BY_VALUE, COOKIE_ATTRIBUTE_KEY_VALUES, COOKIE_ATTRIBUTE_KEY_BY_VALUE
+
+# Stand-in logger for instances without `logToFile`, checked by identity so disabled logging costs a single `is` test.
+_NULL_LOGGER = logging.getLogger('SecureRequests.null')
+_NULL_LOGGER.addHandler(logging.NullHandler())
+_NULL_LOGGER.propagate = False
+# Log records carry the timestamp through the handler's formatter, so messages are only formatted when emitted.
+_LOG_FORMAT = "[%(asctime)s]%(message)s"
+_LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Level names accepted by _logMessage, resolved to their numeric value once.
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+# Read size used when streaming the certificate bundle to disk.
+_CERTIFICATE_CHUNK_SIZE = 64 * 1024
+# Published checksum of the default bundle, fetched with verification on and a bounded wait.
+_CERTIFICATE_CHECKSUM_URL = "https://curl.se/ca/cacert.pem.sha256"
+_CERTIFICATE_CHECKSUM_TIMEOUT = 10
+
+# HTTP methods accepted by makeRequest, dispatched through `requests.Session.request`.
+_HTTP_METHODS = frozenset(("GET", "POST", "PUT", "DELETE", "PATCH"))
+
+# ------------------------------------------------- Default Header Template -------------------------------------------------
+# Immutable choices for the randomized browser fingerprint, built once at import instead of on every headerGenerate call.
+_CHROME_MAJORS = tuple(range(110, 126))
+_SEC_CH_UA_PLATFORMS = ("Windows", "Macintosh", "X11")
+_PLATFORMS = (
+    "Windows NT 10.0; Win64; x64",
+    "Windows NT 6.1; Win64; x64",
+    "Macintosh; Intel Mac OS X 10_15_7",
+    "Macintosh; Intel Mac OS X 11_2_3",
+    "X11; Linux x86_64",
+    "X11; Ubuntu; Linux x86_64",
+)
+# Header names resolved from the enum once, so building the defaults does no enum attribute lookups.
+_HEADER_ACCEPT = HeaderKeys.ACCEPT.value
+_HEADER_CONTENT_TYPE = HeaderKeys.CONTENT_TYPE.value
+_HEADER_SEC_CH_UA = HeaderKeys.SEC_CH_UA.value
+_HEADER_SEC_CH_UA_MOBILE = HeaderKeys.SEC_CH_UA_MOBILE.value
+_HEADER_SEC_CH_UA_PLATFORM = HeaderKeys.SEC_CH_UA_PLATFORM.value
+_HEADER_SEC_FETCH_DEST = HeaderKeys.SEC_FETCH_DEST.value
+_HEADER_SEC_FETCH_MODE = HeaderKeys.SEC_FETCH_MODE.value
+_HEADER_SEC_FETCH_SITE = HeaderKeys.SEC_FETCH_SITE.value
+_HEADER_USER_AGENT = HeaderKeys.USER_AGENT.value
+# Headers carrying the randomized browser fingerprint.
+_FINGERPRINT_HEADERS = (_HEADER_SEC_CH_UA, _HEADER_SEC_CH_UA_PLATFORM, _HEADER_USER_AGENT)
+
+# Complete default header sets for every fingerprint combination, so building the defaults is a single
+# random.choice plus a dict copy. Ordered by Chrome major, then SEC-CH-UA platform, then UA platform.
+_HEADER_TEMPLATES = tuple(
+    {
+        _HEADER_ACCEPT: "application/x-www-form-urlencoded",
+        _HEADER_CONTENT_TYPE: "application/x-www-form-urlencoded",
+        _HEADER_SEC_CH_UA: f'"Google Chrome";v="{chromeMajor}", "Chromium";v="{chromeMajor}", "Not.A/Brand";v="24"',
+        _HEADER_SEC_CH_UA_MOBILE: "?0",
+        _HEADER_SEC_CH_UA_PLATFORM: f'"{secCHUAPlatform}"',
+        _HEADER_SEC_FETCH_DEST: "empty",
+        _HEADER_SEC_FETCH_MODE: "cors",
+        _HEADER_SEC_FETCH_SITE: "same-site",
+        _HEADER_USER_AGENT: f"Mozilla/5.0 ({platform}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{chromeMajor}.0.0.0 Safari/537.36",
+    }
+    for chromeMajor, secCHUAPlatform, platform in product(_CHROME_MAJORS, _SEC_CH_UA_PLATFORMS, _PLATFORMS)
+)
+
+# ------------------------------------------------ Cookie Attribute Parsing ------------------------------------------------
+def _parseCookieBool(value: str) -> Union[bool, str]:
+    """Returns the bool a serialized `True`/`False` attribute stood for, other values unchanged."""
+    return _COOKIE_BOOL_VALUES.get(value, value)
+
+def _parseCookieInt(value: str) -> Union[int, str]:
+    """Returns the attribute as an int, or unchanged if it is not a number."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+def _parseCookieDatetime(value: str) -> Union[datetime, str]:
+    """Returns the attribute as a datetime if it is in ISO format (as `str(datetime)` writes it), otherwise unchanged."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return value
+
+_COOKIE_BOOL_VALUES = {"True": True, "False": False}
+# Restores the types declared for CookieAttributeKeys, attributes without an entry stay strings.
+_COOKIE_ATTRIBUTE_PARSERS = {
+    CookieAttributeKeys.EXPIRES: _parseCookieDatetime,
+    CookieAttributeKeys.SECURE: _parseCookieBool,
+    CookieAttributeKeys.HTTP_ONLY: _parseCookieBool,
+    CookieAttributeKeys.MAX_AGE: _parseCookieInt,
+    CookieAttributeKeys.SAME_PARTY: _parseCookieBool,
+    CookieAttributeKeys.PARTITIONED: _parseCookieBool,
+}
+
+def _formatCookieInfo(cookieInfo: Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]) -> str:
+    """Joins the cookie attributes into their `name=value|name=value` form, passing plain string names through."""
+    return '|'.join([f'{COOKIE_ATTRIBUTE_KEY_VALUES.get(key, key)}={value}' for key, value in cookieInfo.items()])
 
 class TLSAdapter(requests.adapters.HTTPAdapter):
     """
@@ -87,12 +196,22 @@ class TLSAdapter(requests.adapters.HTTPAdapter):
 
     Methods
     -------
-    initPoolmanager(*args: Any, **kwargs: Any) -> None
-        Initializes and configures the connection pool manager with the specified SSL context.
-    _createSSLCOntext() -> ssl.SSLContext
-        Creates a default SSL context with specific cipher settings.
+    __setstate__(state) -> None
+        Restores a pickled adapter without a custom SSL context.
+    build_connection_pool_key_attributes(request, verify, cert=None) -> Tuple[Any, Any]
+        Adds the SSL context to the pool key of verified HTTPS requests.
+    cert_verify(conn, url, verify, cert) -> None
+        Keeps urllib3 from loading the CA bundle into a shared SSL context again on every connect.
+    _createSSLContext(caBundle: Optional[str] = None) -> ssl.SSLContext
+        Returns the shared SSL context for the default trust store or a CA bundle, with specific cipher settings.
+    _discardSSLContext(caBundle: str) -> None
+        Drops the shared SSL context of a CA bundle, so a replaced bundle is loaded again.
 
     """
+    # Contexts built on first use and shared by every adapter, keyed by CA bundle (None for the default trust store).
+    # A bundle is read once per process, `_discardSSLContext` drops its context when the file is replaced.
+    _sharedSSLContexts: Dict[Optional[str], ssl.SSLContext] = {}
+    _sharedSSLContextLock = threading.Lock()
 
     def __init__(
         self, SSLContext: Optional[ssl.SSLContext] = None, **kwargs: Any
@@ -114,39 +233,216 @@ class TLSAdapter(requests.adapters.HTTPAdapter):
         self.SSLContext = SSLContext
         super().__init__(**kwargs)
 
-    def initPoolmanager(self, *args: Any, **kwargs: Any) -> None:
+    def __setstate__(self, state: Dict[str, Any]) -> None:
         """
-        Initializes and configures the connection pool manager with the specified SSL context.
+        Restores a pickled or copied adapter.
+
+        SSL contexts cannot be pickled, so `SSLContext` is not part of the state. A restored adapter
+        uses the shared default context, which is only built once per process.
 
         Parameters
         ----------
-        args : Any
-            Positional arguments passed to the parent `init_poolmanager`.
-        kwargs : Any
-            Keyword arguments passed to the parent `init_poolmanager`.
+        state : Dict[str, Any]
+            The state produced by `HTTPAdapter.__getstate__`.
 
         Returns
         -------
         None
         """
-        context = self.SSLContext or self._createSSLCOntext()
-        kwargs['ssl_context'] = context
-        super().init_poolmanager(*args, **kwargs)
+        self.SSLContext = None
+        super().__setstate__(state)
+
+    def build_connection_pool_key_attributes(
+        self, request: requests.PreparedRequest, verify: Union[bool, str], cert: Any = None
+    ) -> Tuple[Any, Any]:
+        """
+        Builds the urllib3 pool key attributes and adds the SSL context for verified HTTPS requests.
+
+        Requests with `verify=False` keep urllib3's default context, since a context with hostname
+        checking enabled cannot be switched to `CERT_NONE`. Requests with a client certificate keep it
+        too, since urllib3 loads the certificate into the context it is given and a shared context would
+        present it on every later connection. When `verify` is a CA bundle path, the bundle is loaded once
+        into a context of its own that trusts only that bundle. A custom `SSLContext` is only used with
+        `verify=True`.
+
+        Parameters
+        ----------
+        request : requests.PreparedRequest
+            The request that is about to be sent.
+        verify : Union[bool, str]
+            Whether to verify the server certificate, or the path to a CA bundle.
+        cert : Any, optional
+            The client certificate passed to the parent implementation.
+
+        Returns
+        -------
+        Tuple[Dict[str, Any], Dict[str, Any]]
+            The host parameters and pool keyword arguments for urllib3.
+        """
+        hostParams, poolKwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        if verify and not cert and hostParams["scheme"] == "https":
+            if isinstance(verify, str):
+                try:
+                    poolKwargs["ssl_context"] = self._createSSLContext(verify)
+                except OSError:
+                    # Leave the path to urllib3 so a missing bundle raises its usual error
+                    pass
+            else:
+                poolKwargs["ssl_context"] = self.SSLContext or self._createSSLContext()
+        return hostParams, poolKwargs
+
+    def cert_verify(self, conn: Any, url: str, verify: Union[bool, str], cert: Any) -> None:
+        """
+        Sets the certificate options on the connection pool, like the parent implementation.
+
+        When the pool uses one of the shared SSL contexts, the CA bundle is already loaded into it,
+        so the bundle is taken off the pool again. urllib3 would otherwise load it into the shared
+        context on every new connection.
+
+        Parameters
+        ----------
+        conn : Any
+            The urllib3 connection pool the request is sent on.
+        url : str
+            The requested URL.
+        verify : Union[bool, str]
+            Whether to verify the server certificate, or the path to a CA bundle.
+        cert : Any
+            The client certificate of the request.
 
-    def _createSSLCOntext(self) -> ssl.SSLContext:
+        Returns
+        -------
+        None
+        """
+        super().cert_verify(conn, url, verify, cert)
+        context = getattr(conn, "conn_kw", {}).get("ssl_context")
+        if context is not None and any(context is shared for shared in self._sharedSSLContexts.values()):
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+
+    @classmethod
+    def _createSSLContext(cls, caBundle: Optional[str] = None) -> ssl.SSLContext:
         """
-        Creates a default SSL context with specific cipher settings.
+        Returns the shared SSL context with specific cipher settings, creating it on first use.
+        Without `caBundle` the context trusts the system store and the default bundle of requests,
+        with it only the given bundle file or directory.
+        Session tickets are enabled, TLS compression is disabled and TLS 1.2 is the minimum accepted protocol version.
+
+        Parameters
+        ----------
+        caBundle : str, optional
+            Path to a CA bundle file or directory. Defaults to `None`.
 
         Returns
         -------
         ssl.SSLContext
-            The default SSL context with specific cipher settings.
-        
+            The SSL context with specific cipher settings.
+
+        Raises
+        ------
+        OSError
+            If the CA bundle does not exist or cannot be loaded.
         """
-        context = ssl.create_default_context()
-        context.set_ciphers('HIGH:!DH:!aNULL')
+        context = cls._sharedSSLContexts.get(caBundle)
+        if context is None:
+            with cls._sharedSSLContextLock:
+                context = cls._sharedSSLContexts.get(caBundle)
+                if context is None:
+                    if caBundle is None:
+                        # What urllib3 loaded on top of the system store on every connect, now loaded once
+                        context = ssl.create_default_context()
+                        context.load_verify_locations(cafile=requests.certs.where())
+                    else:
+                        # No default certs, so the bundle is the only trust anchor
+                        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+                        if os.path.isdir(caBundle):
+                            context.load_verify_locations(capath=caBundle)
+                        else:
+                            context.load_verify_locations(cafile=caBundle)
+                    context.set_ciphers('HIGH:!DH:!aNULL')
+                    # Allow session tickets and negotiate TLS 1.3 where the server supports it
+                    context.options &= ~ssl.OP_NO_TICKET
+                    context.minimum_version = ssl.TLSVersion.TLSv1_2
+                    # Pinned explicitly rather than relying on the defaults of create_default_context
+                    context.options |= ssl.OP_NO_COMPRESSION
+                    context.check_hostname = True
+                    cls._sharedSSLContexts[caBundle] = context
         return context
 
+    @classmethod
+    def _discardSSLContext(cls, caBundle: str) -> None:
+        """
+        Drops the shared SSL context of a CA bundle, so the next request loads the bundle again.
+
+        Parameters
+        ----------
+        caBundle : str
+            Path to the CA bundle file or directory.
+
+        Returns
+        -------
+        None
+        """
+        with cls._sharedSSLContextLock:
+            cls._sharedSSLContexts.pop(caBundle, None)
+
+class _SharedPoolsMixin:
+    """Keeps `close` from tearing down pools that other instances are still using."""
+
+    def close(self) -> None:
+        """
+        Leaves the shared pools open when one of the sessions using the adapter is closed.
+
+        Returns
+        -------
+        None
+        """
+
+class _SharedHTTPAdapter(_SharedPoolsMixin, requests.adapters.HTTPAdapter):
+    """`HTTPAdapter` mounted by `_sharedAdapter`, see `_SharedPoolsMixin`."""
+
+class _SharedTLSAdapter(_SharedPoolsMixin, TLSAdapter):
+    """`TLSAdapter` mounted by `_sharedAdapter`, see `_SharedPoolsMixin`."""
+
+# Shared counterpart of each adapter class `_sharedAdapter` is asked for.
+_SHARED_ADAPTER_CLASSES: Dict[type, type] = {
+    requests.adapters.HTTPAdapter: _SharedHTTPAdapter,
+    TLSAdapter: _SharedTLSAdapter,
+}
+
+# Adapters shared between instances with `sharePools`, keyed by adapter class and pool sizes.
+_SHARED_ADAPTERS: Dict[Tuple[type, int, int], requests.adapters.HTTPAdapter] = {}
+_SHARED_ADAPTERS_LOCK = threading.Lock()
+
+def _sharedAdapter(adapterClass: type, poolConnections: int, poolMaxsize: int) -> requests.adapters.HTTPAdapter:
+    """
+    Returns the process-wide adapter for the given class and pool sizes, creating it on first use.
+    The adapter ignores `close`, so closing one session does not close the pools of the others.
+
+    Parameters
+    ----------
+    adapterClass : type
+        The adapter class to mount, `TLSAdapter` or `HTTPAdapter`.
+    poolConnections : int
+        The number of per-host connection pools kept by the adapter.
+    poolMaxsize : int
+        The maximum number of connections kept alive per host pool.
+
+    Returns
+    -------
+    requests.adapters.HTTPAdapter
+        The shared adapter.
+    """
+    key = (adapterClass, poolConnections, poolMaxsize)
+    adapter = _SHARED_ADAPTERS.get(key)
+    if adapter is None:
+        with _SHARED_ADAPTERS_LOCK:
+            adapter = _SHARED_ADAPTERS.get(key)
+            if adapter is None:
+                sharedClass = _SHARED_ADAPTER_CLASSES[adapterClass]
+                adapter = _SHARED_ADAPTERS[key] = sharedClass(pool_connections=poolConnections, pool_maxsize=poolMaxsize)
+    return adapter
+
 class SecureRequests:
     """
     This class provides methods to make HTTP requests with enhanced security features, including
@@ -157,14 +453,28 @@ class SecureRequests:
     session : requests.Session
         The `requests.Session` object used for making HTTP requests.
     headers : dict
-        The headers to include in the requests.
+        The headers to include in the requests. Sent on top of `session.headers`, so a removed header falls
+        back to the session's value (e.g. the default User-Agent of `requests`).
     cookies : dict
         The cookies to include in the requests.
     logger : logging.Logger
-        The logger object for logging messages. Only available if `logToFile` is set to True.
+        The logger object for logging messages. Only writes anywhere if `logToFile` is set to True,
+        otherwise it is a logger with a `NullHandler`.
         Named 'SecureRequests'
     verify : Union[bool, str]
         The path to the SSL certificate file or False if not using SSL.
+    poolConnections : int
+        The number of per-host connection pools kept by each mounted adapter. Only applies to sessions the
+        instance creates itself, a passed `session` keeps its adapters apart from the TLS one for HTTPS.
+    poolMaxsize : int
+        The maximum number of connections kept alive per host pool, see `poolConnections`.
+    stableUA : bool
+        Whether requests keep the instance's browser fingerprint. If False, every request rolls a new one for the
+        Sec-CH-UA, Sec-CH-UA-Platform and User-Agent headers not changed on the instance. See `headerRefresh`.
+    sharePools : bool
+        Whether the mounted adapters, and with them the connection pools, are shared with other instances
+        using the same pool sizes. Only applies to sessions the instance creates itself, see `poolConnections`.
+        Closing a session leaves the shared pools open.
 
     Methods
     -------
@@ -173,12 +483,20 @@ class SecureRequests:
         Optionally verifies the checksum of the fetched certificate, given a string - or if True, fetches the checksum file from curl.se.
     makeRequest(url:str, method:str = "GET", headers:Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
         Makes an HTTP request with the specified parameters.
+    makeRequests(calls:List[Tuple[str, str, Optional[Dict[str, str]][, Dict[str, Any]]]], maxWorkers:int = 8) -> List[requests.Response]:
+        Makes several HTTP requests concurrently over the shared session, with optional per-request keyword arguments.
     _logRequest(method:str, url:str, response:requests.Response, **kwargs:Any) -> None:
         Logs an HTTP request and response details.
-    _logMessage(message:str, level:Union[str, int]="DEBUG", category:str = ""):
+    _logMessage(message:str, level:Union[str, int]="DEBUG", category:str = "", *args:Any):
         Logs a message with the specified logging level and category.
+    _buildDefaultHeaders() -> Dict[str, str]:
+        Builds the default headers with a randomized browser fingerprint.
     headerGenerate(customHeaders: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
-        Generates default headers with optional custom values.
+        Generates default headers with a new browser fingerprint and optional custom values.
+    _mergeCustomHeaders(headers: Dict[str, str], customHeaders: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        Merges custom headers into a set of default headers.
+    headerRefresh() -> None:
+        Rolls a new browser fingerprint and applies it to the instance headers.
     headerSetKey(key: HeaderKeys, value: str) -> None:
         Sets a specific header key to a given value.
     headerRemoveKey(key: HeaderKeys) -> None:
@@ -223,7 +541,11 @@ class SecureRequests:
             logExtensive: bool = None,
             silent: Optional[bool] = None,
             suppressWarnings: Optional[bool] = None,
-            session: requests.Session = None) -> None:
+            session: requests.Session = None,
+            poolConnections: Optional[int] = None,
+            poolMaxsize: Optional[int] = None,
+            stableUA: Optional[bool] = None,
+            sharePools: Optional[bool] = None) -> None:
         """
         Initializes the SecureRequests object with the specified parameters and defaults to the configuration settings from the config module.
         """
@@ -234,53 +556,83 @@ class SecureRequests:
         self.requests = requests
         self.datetime = datetime 
 
+        # Read the configuration once, every fallback below comes from this copy
+        settings = config.snapshot()
+
         # ---------------------------------------- Initialize Security Related Variables ----------------------------------------
         self.verify = False
-        self.unsafe = unsafe if unsafe is not None else config.getUnsafe()
-        self.useTLS = useTLS if useTLS is not None else config.getUseTLS()
+        self.unsafe = unsafe if unsafe is not None else settings['unsafe']
+        self.useTLS = useTLS if useTLS is not None else settings['useTLS']
         self.session = session if session else self.requests.session()
-        if self.useTLS and not self.unsafe:
-            self.session.mount("https://", TLSAdapter())
+        self.logger = _NULL_LOGGER
+        # Parsed cookie attributes keyed by cookie name, paired with the jar value they were parsed from
+        self._cookieCache: Dict[str, Tuple[str, Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]] = {}
+        # Cookie objects written by cookieUpdate, keyed by cookie name
+        self._cookiePool: Dict[str, Cookie] = {}
+
+        # Size the pools so repeated requests to the same hosts reuse connections instead of re-handshaking
+        self.poolConnections = poolConnections if poolConnections is not None else settings['poolConnections']
+        self.poolMaxsize = poolMaxsize if poolMaxsize is not None else settings['poolMaxsize']
+        # Shared adapters let new instances reuse the keep-alive connections of earlier ones
+        self.sharePools = sharePools if sharePools is not None else settings['sharePools']
+        httpsAdapterClass = TLSAdapter if self.useTLS and not self.unsafe else self.requests.adapters.HTTPAdapter
+        httpAdapterClass = self.requests.adapters.HTTPAdapter
+        if session is not None:
+            # A caller's session keeps its own adapters, e.g. with retries, only TLS replaces the HTTPS one
+            if self.useTLS and not self.unsafe:
+                self.session.mount("https://", TLSAdapter())
+        elif self.sharePools:
+            self.session.mount("https://", _sharedAdapter(httpsAdapterClass, self.poolConnections, self.poolMaxsize))
+            self.session.mount("http://", _sharedAdapter(httpAdapterClass, self.poolConnections, self.poolMaxsize))
+        else:
+            poolOptions = {"pool_connections": self.poolConnections, "pool_maxsize": self.poolMaxsize}
+            self.session.mount("https://", httpsAdapterClass(**poolOptions))
+            self.session.mount("http://", httpAdapterClass(**poolOptions))
 
         # ----------------------------------------------- Certificate Related Stuff -----------------------------------------------
-        self.certificateURL = certificateURL if certificateURL else config.getCertificateURL()
-        self.certificatePath = certificatePath if certificatePath else config.getCertificatePath()
-        self.certificateVerifyChecksum = certificateVerifyChecksum if certificateVerifyChecksum is not None else config.getCertificateVerifyChecksum()
+        self.certificateURL = certificateURL if certificateURL else settings['certificateURL']
+        self.certificatePath = certificatePath if certificatePath else settings['certificatePath']
+        self.certificateVerifyChecksum = certificateVerifyChecksum if certificateVerifyChecksum is not None else settings['certificateVerifyChecksum']
+        # Certificate path last seen on disk, so repeated checks of the same path can skip the stat
+        self._certPathExists: Optional[str] = None
 
         # ------------------------------------------ Initialize Config Related Variables ------------------------------------------
 
         # Initialize attributes, falling back to config if not provided
-        self.logToFile = logToFile if logToFile is not None else config.getLogToFile()
-        self.logLevel = logLevel if logLevel is not None else config.getLogLevel()
-        self.logPath = logPath if logPath is not None else config.getLogPath()
-        self.logExtensive = logExtensive if logExtensive is not None else config.getLogExtensive()
-        self.silent = silent if silent is not None else config.getSilent()
-        self.suppressWarnings = suppressWarnings if suppressWarnings is not None else config.getSuppressWarnings()
-        
-        self.headers = self.headerGenerate(headers)
+        self.logToFile = logToFile if logToFile is not None else settings['logToFile']
+        self.logLevel = logLevel if logLevel is not None else settings['logLevel']
+        self.logPath = logPath if logPath is not None else settings['logPath']
+        self.logExtensive = logExtensive if logExtensive is not None else settings['logExtensive']
+        self.silent = silent if silent is not None else settings['silent']
+        self.suppressWarnings = suppressWarnings if suppressWarnings is not None else settings['suppressWarnings']
+        self.stableUA = stableUA if stableUA is not None else settings['stableUA']
+
+        # Fingerprint of the instance headers, rerolled by headerRefresh
+        self._defaultHeaders = self._buildDefaultHeaders()
+        self.headers = self._mergeCustomHeaders(dict(self._defaultHeaders), headers)
         if useEnv:
             config.EVarSetMode(True)
             if customEnvVars:
                 config.EVarSet(customEnvVars)
 
-        if self.logToFile:
+        # Silent instances keep the null logger instead of disabling logging process-wide
+        if self.logToFile and not self.silent:
             handler = logging.FileHandler(self.logPath)
+            handler.setFormatter(logging.Formatter(_LOG_FORMAT, datefmt=_LOG_DATE_FORMAT))
             self.logger = logging.getLogger('SecureRequests')
             self.logger.setLevel(self.logLevel)
             self.logger.addHandler(handler)
 
-        if self.silent:
-            logging.disable()
-
         if self.suppressWarnings:
+            # Installed per instance, a filter from an earlier instance may be gone with its catch_warnings block
             warnings.filterwarnings("ignore", category=InsecureRequestWarning)
 
-        self.fetchCertificate = certificateNeedFetch if certificateNeedFetch is not None else config.getCertificateNeedFetch()
+        self.fetchCertificate = certificateNeedFetch if certificateNeedFetch is not None else settings['certificateNeedFetch']
         if self.fetchCertificate:
             self._certificateFetch(verifyChecksum=self.certificateVerifyChecksum)
         self.verify = self._certificateSet()
 
-    def _logMessage(self, message:str, level:Union[str, int]="DEBUG", category:str = ""):
+    def _logMessage(self, message:str, level:Union[str, int]="DEBUG", category:str = "", *args:Any):
         """
         Logs a message using the instance's logger at the specified logging level.
         
@@ -291,17 +643,23 @@ class SecureRequests:
         message : str, optional
             The message to log. Defaults to "DEBUG"
         category : str, optional
+        *args : Any, optional
+            Arguments for %-style placeholders in `message`, only formatted when the record is emitted.
 
         Output
         ------
         ->> [15.07.2024 12:00:00][DEBUG][Category] Message
         """
-        if hasattr(self, 'logger'):
-            timestamp = self.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            logFunction = getattr(self.logger, level, None)
-            category = f"[{category}]" if category else ""
-            if callable(logFunction):
-                logFunction(f"[{timestamp}][{level.upper()}]{category} {message}")
+        if self.logger is _NULL_LOGGER:
+            return
+        levelNumber = _LOG_LEVELS.get(level)
+        if levelNumber is None or not self.logger.isEnabledFor(levelNumber):
+            return
+        categoryTag = f"[{category}]" if category else ""
+        if args:
+            self.logger.log(levelNumber, "[%s]%s " + message, level.upper(), categoryTag, *args)
+        else:
+            self.logger.log(levelNumber, "[%s]%s %s", level.upper(), categoryTag, message)
 
     # ***********************************************************************************************************************
     # *                                            Certificate Related Stuff                                                *
@@ -324,7 +682,7 @@ class SecureRequests:
         ----------------
         __fetchChecksum() -> str:
             Fetches the checksum of the certificate.
-        __verifyCertificate(content:Any, expectedChecksum:str) -> bool:
+        __verifyCertificate(calculatedHash:str, expectedChecksum:str) -> bool:
             Verifies the checksum of the fetched certificate.
 
         Returns
@@ -352,27 +710,27 @@ class SecureRequests:
         def __fetchChecksum():
             try:
                 self._logMessage("Fetching checksum of the certificate.", "info", "Certificate")
-                response = self.makeRequest('https://curl.se/ca/cacert.pem.sha256')
-                if response.status_code == 200:
-                    checksum = response.text.split()
-                    if len(checksum) == 2:
-                        return checksum[0]
-                    self._logMessage("Unexpected checksum format.", "error", "Certificate")
+                # Plain session call: the checksum needs no response handling or request logging
+                response = self.session.get(_CERTIFICATE_CHECKSUM_URL, verify=True, timeout=_CERTIFICATE_CHECKSUM_TIMEOUT)
+                response.raise_for_status()
+                checksum = response.text.split()
+                if len(checksum) == 2:
+                    return checksum[0]
+                self._logMessage("Unexpected checksum format.", "error", "Certificate")
             except Exception as e:
                 self._logMessage(f"Exception occurred while fetching checksum: {e}", "error", "Certificate")
             return None
 
         """Verifies the checksum of the fetched certificate."""
-        def __verifyCertificate(content:Any, expectedChecksum:str) -> bool:
-            sha256Hash = sha256()
-            sha256Hash.update(content)
-            calculatedHash = sha256Hash.hexdigest()
+        def __verifyCertificate(calculatedHash:str, expectedChecksum:str) -> bool:
             self._logMessage(f"Calculated checksum: {calculatedHash}", "info", "Certificate")
             self._logMessage(f"Expected checksum: {expectedChecksum}", "info", "Certificate")
-            return calculatedHash == expectedChecksum
+            # Constant-time comparison, encoded so a non-ASCII checksum argument cannot raise
+            return hmac.compare_digest(calculatedHash.encode(), expectedChecksum.encode())
 
 
         if self.pathExists(self.certificatePath):
+            self._certPathExists = self.certificatePath
             self.verify = self.certificatePath
             self._logMessage("Certificate exists and setting it to use.", "debug", "Certificate")
             if not force:
@@ -381,38 +739,60 @@ class SecureRequests:
             self._logMessage("Certificate does not exist. Fetching it.", "critical", "Certificate")
 
         try:
-            response = self.makeRequest(self.certificateURL, method="GET")
-            if response.status_code == 200:
-                content = response.content
-                # If checksum verification is enabled, fetch the checksum and verify it
-                # If its a string or True
-                if verifyChecksum:
-                    self._logMessage("Verifying checksum of the fetched certificate.", "info", "Certificate")
-                    # Use either the given string if its not a bool or fetch the checksum file
-                    expectedChecksum = __fetchChecksum() if isinstance(verifyChecksum, bool) else verifyChecksum
-                    print("<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<")
-                    if expectedChecksum:
-                        verify = __verifyCertificate(content, expectedChecksum)
-                        if not verify:
-                            print(">>>>>>>>>>>>failed")
-                            self._logMessage("Checksum verification failed.", "error", "Certificate")
-                            return
-                        else:
-                            print(">>>>>>>>>>>worked")
-                            self._logMessage("Checksum verification successful.", "info", "Certificate")
-                    else:
-                        self._logMessage("Failed to obtain expected checksum.", "error", "Certificate")
-                        return
-                    
-                if not content:
-                    self._logMessage("Fetched certificate is empty.", "error", "Certificate")
+            # If checksum verification is enabled, get the expected checksum before downloading
+            # If its a string or True
+            expectedChecksum = None
+            if verifyChecksum:
+                self._logMessage("Verifying checksum of the fetched certificate.", "info", "Certificate")
+                # Use either the given string if its not a bool or fetch the checksum file
+                expectedChecksum = __fetchChecksum() if isinstance(verifyChecksum, bool) else verifyChecksum
+                if not expectedChecksum:
+                    self._logMessage("Failed to obtain expected checksum.", "error", "Certificate")
                     return
-                
-                with open(self.certificatePath, "wb") as f:
-                    f.write(content)
 
-                self._logMessage("Successfully fetched certificate and saved.", "info", "Certificate")
-                self.verify = self.certificatePath
+            response = self.makeRequest(self.certificateURL, method="GET", stream=True)
+            # Closed on every path, an unread streamed body would keep its pooled connection
+            try:
+                if response.status_code != 200:
+                    return
+                # Stream the bundle into a temporary file next to the target, hashing it on the way
+                partPath = f"{self.certificatePath}.part"
+                sha256Hash = sha256()
+                size = 0
+                try:
+                    with open(partPath, "wb") as f:
+                        for chunk in response.iter_content(_CERTIFICATE_CHUNK_SIZE):
+                            sha256Hash.update(chunk)
+                            size += len(chunk)
+                            f.write(chunk)
+                except BaseException:
+                    # Don't leave a partial bundle behind, the outer handler logs the failure
+                    if os.path.exists(partPath):
+                        os.remove(partPath)
+                    raise
+            finally:
+                response.close()
+
+            if expectedChecksum:
+                verify = __verifyCertificate(sha256Hash.hexdigest(), expectedChecksum)
+                if not verify:
+                    self._logMessage("Checksum verification failed.", "error", "Certificate")
+                    os.remove(partPath)
+                    return
+                else:
+                    self._logMessage("Checksum verification successful.", "info", "Certificate")
+
+            if not size:
+                self._logMessage("Fetched certificate is empty.", "error", "Certificate")
+                os.remove(partPath)
+                return
+
+            os.replace(partPath, self.certificatePath)
+            TLSAdapter._discardSSLContext(self.certificatePath)
+            self._certPathExists = self.certificatePath
+
+            self._logMessage("Successfully fetched certificate and saved.", "info", "Certificate")
+            self.verify = self.certificatePath
         except Exception as e:
             self._logMessage(
                 f"Failed to fetch certificate. Cannot use SSL but the program might work.\n{e}", "critical", "Certificate"
@@ -433,11 +813,11 @@ class SecureRequests:
         ----
         ->> [15.07.2024 12:00:00][DEBUG][Certificate] Setting certificate. Status: /path/to/certificate.pem
         """
-        certificateStatus = (
-            self.certificatePath
-            if not self.unsafe and self.pathExists(self.certificatePath)
-            else False
-        )
+        certificateStatus: Union[str, bool] = False
+        if not self.unsafe:
+            # Compared against the current path, so reassigning certificatePath forces a fresh check
+            if self._certPathExists == self.certificatePath or self.pathExists(self.certificatePath):
+                self._certPathExists = certificateStatus = self.certificatePath
         self._logMessage(f"Setting certificate. Status: {certificateStatus}", "debug", "Certificate")
         return certificateStatus
 
@@ -462,9 +842,9 @@ class SecureRequests:
         url : str
             The URL for the request.
         method : str, optional
-            The HTTP method to use (e.g., 'GET', 'POST'). Defaults to 'GET'.
+            The HTTP method to use (e.g., 'GET', 'POST'), case-insensitive. Defaults to 'GET'.
         headers : dict, optional
-            Custom headers to include with the request. Defaults to None.
+            Headers for this request only, merged on top of the instance headers. Defaults to None.
         **kwargs : Any
             >>> METHOD: get
                 *,
@@ -553,24 +933,78 @@ class SecureRequests:
         ------
         Any exception matching to a status code.
         """
-        srMethods = {
-            "GET": self.session.get,
-            "POST": self.session.post,
-            "PUT": self.session.put,
-            "DELETE": self.session.delete,
-            "PATCH": self.session.patch,
-        }
-
-        if method not in srMethods:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-
-        headers = headers or self.headers
-        response = srMethods[method](
-            url=url, headers=headers, verify=self.verify, **kwargs
+        if method not in _HTTP_METHODS:
+            # Only normalize the case when the fast membership test misses
+            method = method.upper()
+            if method not in _HTTP_METHODS:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+        # Read per call so direct changes to `self.headers` take effect
+        requestHeaders = self.headers
+        if not self.stableUA:
+            # A new fingerprint for this request, for the fingerprint headers not changed on the instance
+            fingerprint = self._buildDefaultHeaders()
+            requestHeaders = {**requestHeaders, **{
+                name: fingerprint[name] for name in _FINGERPRINT_HEADERS
+                if requestHeaders.get(name) == self._defaultHeaders[name]
+            }}
+        if headers:
+            requestHeaders = {**requestHeaders, **headers}
+        response = self.session.request(
+            method, url, headers=requestHeaders, verify=self.verify, **kwargs
         )
-        self._logRequest(method, url, response=response, headers=headers)
+        self._logRequest(method, url, response=response, headers=response.request.headers)
         return response
 
+    def makeRequests(
+        self,
+        calls:List[Union[Tuple[str, str, Optional[Dict[str, str]]], Tuple[str, str, Optional[Dict[str, str]], Dict[str, Any]]]],
+        maxWorkers:int=8
+    ) -> List[requests.Response]:
+        """
+        Makes several HTTP requests concurrently over the instance's session, so they share its connection pools.
+
+        All requests run on the one session, so they also share its cookie jar and the instance headers.
+        Cookies set by responses may land in any order, and the jar must not be iterated or changed,
+        e.g. with `cookieGetAll` or `cookieUpdate`, from other threads while the requests are running.
+
+        Parameters
+        ----------
+        calls : List[Tuple[str, str, Optional[Dict[str, str]]] | Tuple[str, str, Optional[Dict[str, str]], Dict[str, Any]]]
+            The requests to make as `(url, method, headers)` tuples, or `(url, method, headers, kwargs)` to pass
+            further arguments like `data`, `json` or `timeout` to that request, see `makeRequest`.
+        maxWorkers : int, optional
+            The maximum number of requests in flight at once, at least 1. Defaults to 8.
+
+        Returns
+        -------
+        >>> List[requests.Response]
+        ... # The HTTP responses, in the order of `calls`.
+
+        Example
+        -------
+        >>> responses = sr.makeRequests([
+        ...     ("https://httpbin.org/get", "GET", None),
+        ...     ("https://httpbin.org/post", "POST", {"X-Custom-Header": "Value"}, {"json": {"key": "value"}, "timeout": 5}),
+        ... ])
+
+        Raises
+        ------
+        ValueError: If `maxWorkers` is less than 1.
+        The first exception raised by any of the requests, see `makeRequest`.
+        """
+        if maxWorkers < 1:
+            raise ValueError(f"maxWorkers must be at least 1, got {maxWorkers}")
+        if not calls:
+            return []
+
+        def call(request: Tuple[Any, ...]) -> requests.Response:
+            url, method, headers, *rest = request
+            return self.makeRequest(url, method=method, headers=headers, **(rest[0] if rest else {}))
+
+        with ThreadPoolExecutor(max_workers=min(maxWorkers, len(calls))) as executor:
+            return list(executor.map(call, calls))
+
     def _logRequest(self, method:str, url:str, response:requests.Response, **kwargs:Any) -> None:
         """
         Logs the details of the HTTP request if logging is enabled.
@@ -595,25 +1029,43 @@ class SecureRequests:
         -------
         ->> [15.07.2024 12:00:00][REQUEST][SAFE][TLS] GET request to https://example.com/api/data ...
         """
-        if hasattr(self, "logger"):
-            timestamp = self.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            safetyStatus = "[UNSAFE]" if not self.verify else "[SAFE]"
-            tlsStatus = "[TLS]" if self.useTLS else "[NO TLS]"
-            logExtra = f' with headers {kwargs.get("headers")} and params {kwargs}' if self.logExtensive else ''
-            logDefaults = f' with Status Code {response.status_code} - {response.reason}'
-            logBase = f'[{timestamp}][REQUEST]{safetyStatus}{tlsStatus} {method} request to {url}{logExtra}{logDefaults}'
-            if response.status_code == 200:
-                self.logger.info(logBase)
-            else:
-                self.logger.error(logBase)
+        level = logging.INFO if response.status_code == 200 else logging.ERROR
+        if self.logger is _NULL_LOGGER or not self.logger.isEnabledFor(level):
+            return
+        # Formatting is left to the logger, the timestamp is added by the handler's formatter
+        safetyStatus = "[UNSAFE]" if not self.verify else "[SAFE]"
+        tlsStatus = "[TLS]" if self.useTLS else "[NO TLS]"
+        if self.logExtensive:
+            self.logger.log(
+                level, "[REQUEST]%s%s %s request to %s with headers %s and params %s with Status Code %s - %s",
+                safetyStatus, tlsStatus, method, url, kwargs.get("headers"), kwargs, response.status_code, response.reason
+            )
+        else:
+            self.logger.log(
+                level, "[REQUEST]%s%s %s request to %s with Status Code %s - %s",
+                safetyStatus, tlsStatus, method, url, response.status_code, response.reason
+            )
 
     # ***********************************************************************************************************************
     # *                                                 Header Related Stuff                                                *
     # ***********************************************************************************************************************
 
+    def _buildDefaultHeaders(self) -> Dict[str, str]:
+        """
+        Builds a new dictionary of the default headers with a freshly randomized browser fingerprint.
+
+        Returns
+        -------
+        Dict[str, str]
+            The default headers, see `headerGenerate`.
+        """
+        # Copy so per-instance changes never reach the shared template
+        return dict(random.choice(_HEADER_TEMPLATES))
+
     def headerGenerate(self, customHeaders:Optional[Dict[str, Any]]=None) -> Dict[str, str]:
         """
         Generates headers for the session with optional custom values.
+        Every call rolls a new browser fingerprint, the instance headers keep theirs, see `stableUA` and `headerRefresh`.
 
         Parameters
         ----------
@@ -654,48 +1106,60 @@ class SecureRequests:
         ->> [15.07.2024 12:00:00][DEBUG][Header] Added custom headers to the default set.
         ->> [15.07.2024 12:00:00][DEBUG][Header] Custom headers: {'Content-Type': 'application', ... }
         """
-        chromeMajors = list(range(110, 126))
-        SecCHUAPlatform = ["Windows", "Macintosh", "X11"]
-        platforms = [
-            "Windows NT 10.0; Win64; x64",
-            "Windows NT 6.1; Win64; x64",
-            "Macintosh; Intel Mac OS X 10_15_7",
-            "Macintosh; Intel Mac OS X 11_2_3",
-            "X11; Linux x86_64",
-            "X11; Ubuntu; Linux x86_64",
-        ]
-
-        randPlatform = random.choice(platforms)
-        randSecCHUAPlatform = random.choice(SecCHUAPlatform)
-        randChromeMajors = random.choice(chromeMajors)
+        return self._mergeCustomHeaders(self._buildDefaultHeaders(), customHeaders)
+
+    def _mergeCustomHeaders(self, headers:Dict[str, str], customHeaders:Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Merges custom headers into a fresh set of default headers, see `headerGenerate`.
 
+        Parameters
+        ----------
+        headers : Dict[str, str]
+            The default headers, changed in place.
+        customHeaders : Optional[Dict[str, Any]]
+            A dictionary of headers to include or override the default headers.
+
+        Returns
+        -------
+        Dict[str, str]
+            The default headers with the custom headers applied.
+        """
         if not customHeaders:
-            customHeaders = {}
-
-        defaultHeader = {
-            HeaderKeys.ACCEPT.value: "application/x-www-form-urlencoded",
-            HeaderKeys.CONTENT_TYPE.value: "application/x-www-form-urlencoded",
-            HeaderKeys.SEC_CH_UA.value: f'"Google Chrome";v="{randChromeMajors}", "Chromium";v="{randChromeMajors}", "Not.A/Brand";v="24"',
-            HeaderKeys.SEC_CH_UA_MOBILE.value: "?0",
-            HeaderKeys.SEC_CH_UA_PLATFORM.value: f'"{randSecCHUAPlatform}"',
-            HeaderKeys.SEC_FETCH_DEST.value: "empty",
-            HeaderKeys.SEC_FETCH_MODE.value: "cors",
-            HeaderKeys.SEC_FETCH_SITE.value: "same-site",
-            HeaderKeys.USER_AGENT.value: f"Mozilla/5.0 ({randPlatform}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{randChromeMajors}.0.0.0 Safari/537.36"
-        }
-        headers = {key: customHeaders.get(key, defaultValue) for key, defaultValue in defaultHeader.items()}
-
-        # Add any custom headers that are not in the default set
-        for key, value in customHeaders.items():
-            if key not in headers:
-                headers[key] = value
+            return headers
+
+        # The defaults are already a fresh dict, custom values override them in place and new keys are appended
+        headers.update(customHeaders)
 
         if self.logExtensive:
             self._logMessage("Added custom headers to the default set.", "debug", "Header")
-            self._logMessage(f"Custom headers: {headers}", "debug", "Header")
+            self._logMessage("Custom headers: %s", "debug", "Header", headers)
         return headers
     
 
+    def headerRefresh(self) -> None:
+        """
+        Rolls a new browser fingerprint and applies it to the instance headers.
+        Only the Sec-CH-UA, Sec-CH-UA-Platform and User-Agent headers still present on the instance are replaced.
+
+        Returns
+        -------
+        None
+
+        Example
+        -------
+        >>> sr = SecureRequests()
+        >>> sr.headerRefresh()
+
+        Logs
+        ----
+        ->> [15.07.2024 12:00:00][DEBUG][Header] Refreshed browser fingerprint.
+        """
+        self._defaultHeaders = self._buildDefaultHeaders()
+        for name in _FINGERPRINT_HEADERS:
+            if name in self.headers:
+                self.headers[name] = self._defaultHeaders[name]
+        self._logMessage("Refreshed browser fingerprint.", "debug", "Header")
+
     def headerSetKey(self, key:HeaderKeys, value:str) -> None:
         """
         Sets a specific header key to a given value.
@@ -721,8 +1185,9 @@ class SecureRequests:
         Logs
         ->> [15.07.2024 12:00:00][DEBUG][Header] Set Authorization to Bearer token123
         """
-        self.headers[key.value] = value
-        self._logMessage(f"Set {key} to {value}", "debug", "Header")
+        name = HEADER_KEY_VALUES.get(key, key)
+        self.headers[name] = value
+        self._logMessage("Set %s to %s", "debug", "Header", key, value)
 
     def headerRemoveKey(self, key:HeaderKeys) -> None:
         """
@@ -748,9 +1213,10 @@ class SecureRequests:
         ----
         ->> [15.07.2024 12:00:00][DEBUG][Header] Removed key AUTHORIZATION from headers.
         """
-        if key.value in self.headers:
-            del self.headers[key.value]
-            self._logMessage(f"Removed key {key} from headers.", "debug", "Header")
+        name = HEADER_KEY_VALUES.get(key, key)
+        if name in self.headers:
+            del self.headers[name]
+            self._logMessage("Removed key %s from headers.", "debug", "Header", key)
 
     def headerUpdateMultiple(self, newHeader:Dict[HeaderKeys, str]) -> None:
         """
@@ -774,11 +1240,12 @@ class SecureRequests:
 
         Logs
         ----
-        ->> [15.07.2024 12:00:00][DEBUG][Header] Updated Key 'AUTHORIZATION' with Value 'Value'
+        ->> [15.07.2024 12:00:00][DEBUG][Header] Updated 2 keys: {'Authorization': 'Bearer token123', 'Accept': 'application/xml'}
         """
-        for key, value in newHeader.items():
-            self.headers[key.value] = value
-            self._logMessage(f"Updated Key '{key}' with Value '{value}'", "debug", "Header")
+        updates = {HEADER_KEY_VALUES.get(key, key): value for key, value in newHeader.items()}
+        self.headers.update(updates)
+        if updates:
+            self._logMessage("Updated %d keys: %s", "debug", "Header", len(updates), updates)
 
     def headerRemoveMultiple(self, keys:List[HeaderKeys]) -> None:
         """
@@ -801,13 +1268,14 @@ class SecureRequests:
         {'Content-Type': 'application/json'}
 
         Logs
-        ->> [15.07.2024 12:00:00][DEBUG][Header] Removed key AUTHORIZATION from headers.
-        ->> [15.07.2024 12:00:00][DEBUG][Header] Removed key ACCEPT from headers.
+        ->> [15.07.2024 12:00:00][DEBUG][Header] Removed keys ['Accept', 'Authorization'] from headers.
         """
-        for key in keys:
-            if key.value in self.headers:
-                del self.headers[key.value]
-                self._logMessage(f"Removed key {key} from headers.", "debug", "Header")
+        removed = {HEADER_KEY_VALUES.get(key, key) for key in keys} & self.headers.keys()
+        for name in removed:
+            del self.headers[name]
+        if removed:
+            # One record for the whole batch, sorted so the line does not depend on set order
+            self._logMessage("Removed keys %s from headers.", "debug", "Header", sorted(removed))
 
 
     # ***********************************************************************************************************************
@@ -827,11 +1295,12 @@ class SecureRequests:
         -------
             str: A serialized string of cookie attributes.
         """
-        return '|'.join(f'{str(key)}={value}' for key, value in cookieInfo.items())
+        return _formatCookieInfo(cookieInfo)
 
     def _deserializeCookieInfo(self, cookieInfoStr:str) -> Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]:
         """
         Deserializes the string back into a dictionary of cookie attributes.
+        Boolean, integer and ISO datetime attributes are converted back to their types, other values stay strings.
 
         Args
         ----
@@ -847,20 +1316,63 @@ class SecureRequests:
         ->> [15.07.2024 12:00:00][DEBUG][Cookie] Invalid cookie attribute 'invalid'
         ->> [15.07.2024 12:00:00][DEBUG][Cookie] Skipping invalid cookie attribute 'invalid'
         """
-        items = cookieInfoStr.split('|')
         cookieInfo = {}
-        for item in items:
-            if '=' in item:
-                key, value = item.split('=', 1)
-                try:
-                    key = CookieAttributeKeys(key)
-                except ValueError:
-                    self._logMessage(f"Invalid cookie attribute '{item}'", "debug", "Cookie")
+        for item in cookieInfoStr.split('|'):
+            # A single scan finds the separator, an empty `sep` means the item has none
+            key, sep, value = item.partition('=')
+            if not sep:
+                self._logMessage("Skipping invalid cookie attribute '%s'", "debug", "Cookie", item)
+                continue
+            # The attribute names are a closed set, unknown ones are kept as plain strings
+            attribute = COOKIE_ATTRIBUTE_KEY_BY_VALUE.get(key)
+            if attribute is None:
+                self._logMessage("Invalid cookie attribute '%s'", "debug", "Cookie", item)
                 cookieInfo[key] = value
             else:
-                self._logMessage(f"Skipping invalid cookie attribute '{item}'", "debug", "Cookie")
+                parser = _COOKIE_ATTRIBUTE_PARSERS.get(attribute)
+                cookieInfo[attribute] = parser(value) if parser else value
         return cookieInfo
 
+    def _cookieInfoFromJar(self, name:str, cookieValue:str) -> Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]:
+        """
+        Returns the attributes of a cookie from the jar, reusing the last parse of the cookie
+        as long as the jar still holds the value it was parsed from.
+
+        Args
+        ----
+            name (str): The name of the cookie.
+            cookieValue (str): The current value of the cookie in the session jar.
+
+        Returns
+        -------
+            Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]: 
+                A copy of the cookie attributes.
+        """
+        cached = self._cookieCache.get(name)
+        if cached is not None and cached[0] == cookieValue:
+            return dict(cached[1])
+        cookieInfo = self._deserializeCookieInfo(cookieValue)
+        self._cookieCache[name] = (cookieValue, cookieInfo)
+        return dict(cookieInfo)
+
+    def _cookieStore(self, name:str, cookieValue:str) -> None:
+        """
+        Stores a serialized cookie value in the session's cookie jar.
+
+        Args
+        ----
+            name (str): The name of the cookie.
+            cookieValue (str): The serialized cookie attributes.
+        """
+        # Reuse this instance's Cookie object for the name instead of building a new one on every update,
+        # which jar.set and jar.update do through create_cookie for every value they are given.
+        cookie = self._cookiePool.get(name)
+        if cookie is None:
+            cookie = self._cookiePool[name] = create_cookie(name, cookieValue)
+        else:
+            cookie.value = cookieValue
+        self.session.cookies.set_cookie(cookie)
+
     def cookieUpdate(self, key:CookieKeys, cookieInfo:Union[str, Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]) -> None:
         """
         Sets or updates a single cookie with specified attributes.
@@ -876,10 +1388,13 @@ class SecureRequests:
         """
         if isinstance(cookieInfo, str):
             cookieInfo = self._deserializeCookieInfo(cookieInfo)
-        
+
+        name = COOKIE_KEY_VALUES.get(key, key)
         cookieValue = self._serializeCookieInfo(cookieInfo)
-        self.session.cookies.set(str(key), cookieValue)
-        self._logMessage(f"Set cookie {key} to {cookieInfo}", "debug", "Cookie")
+        self._cookieStore(name, cookieValue)
+        # Parsed again from the jar on the next read, so cached entries always have the normalized keys and types
+        self._cookieCache.pop(name, None)
+        self._logMessage("Set cookie %s to %s", "debug", "Cookie", key, cookieInfo)
 
     def cookieGet(self, key:CookieKeys) -> Optional[Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]:
         """
@@ -895,9 +1410,10 @@ class SecureRequests:
             A dictionary containing the cookie attributes, or None if the cookie does not exist.
         None if none
         """
-        cookieValue = self.session.cookies.get(str(key))
+        name = COOKIE_KEY_VALUES.get(key, key)
+        cookieValue = self.session.cookies.get(name)
         if cookieValue:
-            return self._deserializeCookieInfo(cookieValue)
+            return self._cookieInfoFromJar(name, cookieValue)
         return None
 
     def cookieRemove(self, key:CookieKeys) -> None:
@@ -912,8 +1428,11 @@ class SecureRequests:
         ----
         ->> [15.07.2024 12:00:00][DEBUG][Cookie] Removed cookie 'key'
         """
-        self.session.cookies.pop(str(key), None)
-        self._logMessage(f"Removed cookie {key}", "debug", "Cookie")
+        name = COOKIE_KEY_VALUES.get(key, key)
+        # One pass over the jar, pop() looks the cookie up first and raises on duplicate names across domains
+        remove_cookie_by_name(self.session.cookies, name)
+        self._cookieCache.pop(name, None)
+        self._logMessage("Removed cookie %s", "debug", "Cookie", key)
 
     def cookieUpdateMultiple(self, cookies:Dict[CookieKeys, Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]) -> None:
         """
@@ -923,13 +1442,28 @@ class SecureRequests:
         ----
             cookies (Dict[CookieKeys, Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]): 
                 A dictionary containing multiple cookies and their attributes.
+
+        Logs
+        ----
+        ->> [15.07.2024 12:00:00][DEBUG][Cookie] Set 2 cookies: {'key': 'cookieInfo', 'otherKey': 'cookieInfo'}
         """
+        updated = {}
         for key, cookieInfo in cookies.items():
-            self.cookieUpdate(key, cookieInfo)
+            if isinstance(cookieInfo, str):
+                cookieInfo = self._deserializeCookieInfo(cookieInfo)
+            name = COOKIE_KEY_VALUES.get(key, key)
+            cookieValue = self._serializeCookieInfo(cookieInfo)
+            self._cookieStore(name, cookieValue)
+            self._cookieCache.pop(name, None)
+            updated[name] = cookieInfo
+        if updated:
+            self._logMessage("Set %d cookies: %s", "debug", "Cookie", len(updated), updated)
 
     def cookieGetAll(self) -> Dict[CookieKeys, Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]:
         """
         Retrieves all cookies with their attributes.
+        Cookies whose names are not part of `CookieKeys`, e.g. set by a server, are skipped.
+        The jar is read on every call, only the parsed attributes of unchanged cookie values are reused.
 
         Returns
         -------
@@ -938,7 +1472,9 @@ class SecureRequests:
         """
         allCookies = {}
         for cookie in self.session.cookies:
-            key = CookieKeys(cookie.name)
-            cookieInfo = self._deserializeCookieInfo(cookie.value)
-            allCookies[key] = cookieInfo
+            name = cookie.name
+            key = COOKIE_KEY_BY_VALUE.get(name)
+            if key is None:
+                continue
+            allCookies[key] = self._cookieInfoFromJar(name, cookie.value)
         return allCookies
\ No newline at end of file
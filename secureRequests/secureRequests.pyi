@@ -3,9 +3,11 @@ This module provides utilities for making secure HTTP requests using the `reques
 It includes custom transport adapters, certificate management, and header/cookie handling with enums.
 """
 
-from typing import Dict, Any, Optional, List, Union, Callable
+from typing import Dict, Any, Optional, List, Tuple, Union, Callable, ClassVar
 import requests
 import ssl
+import threading
+from http.cookiejar import Cookie
 import logging
 from datetime import datetime
 from .secureRequestsEnums import HeaderKeys, CookieKeys, CookieAttributeKeys
@@ -13,16 +15,46 @@ from os.path import exists as PathExists
 from os.path import join as PathJoin
 
 class TLSAdapter(requests.adapters.HTTPAdapter):
+    SSLContext: Optional[ssl.SSLContext]
+    _sharedSSLContexts: ClassVar[Dict[Optional[str], ssl.SSLContext]]
+    _sharedSSLContextLock: ClassVar[threading.Lock]
+
     def __init__(self, SSLContext: Optional[ssl.SSLContext] = None, **kwargs: Any) -> None: ...
-    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None: ...
-    def _createSSLContext(self) -> ssl.SSLContext: ...
+    def __setstate__(self, state: Dict[str, Any]) -> None: ...
+    def build_connection_pool_key_attributes(self, request: requests.PreparedRequest, verify: Union[bool, str], cert: Any = None) -> Tuple[Any, Any]: ...
+    def cert_verify(self, conn: Any, url: str, verify: Union[bool, str], cert: Any) -> None: ...
+    @classmethod
+    def _createSSLContext(cls, caBundle: Optional[str] = None) -> ssl.SSLContext: ...
+    @classmethod
+    def _discardSSLContext(cls, caBundle: str) -> None: ...
+
+class _SharedPoolsMixin:
+    def close(self) -> None: ...
+
+class _SharedHTTPAdapter(_SharedPoolsMixin, requests.adapters.HTTPAdapter): ...
+
+class _SharedTLSAdapter(_SharedPoolsMixin, TLSAdapter): ...
+
+_SHARED_ADAPTER_CLASSES: Dict[type, type]
+_SHARED_ADAPTERS: Dict[Tuple[type, int, int], requests.adapters.HTTPAdapter]
+_SHARED_ADAPTERS_LOCK: threading.Lock
+
+def _sharedAdapter(adapterClass: type, poolConnections: int, poolMaxsize: int) -> requests.adapters.HTTPAdapter: ...
 
 class SecureRequests:
     session: requests.Session
     headers: Dict[str, str]
     cookies: Dict[str, Dict[str, Union[str, bool, int, datetime]]]
-    logger: Optional[logging.Logger]
+    logger: logging.Logger
     verify: Optional[Union[bool, str]]
+    poolConnections: int
+    poolMaxsize: int
+    stableUA: bool
+    sharePools: bool
+    _defaultHeaders: Dict[str, str]
+    _certPathExists: Optional[str]
+    _cookieCache: Dict[str, Tuple[str, Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]]
+    _cookiePool: Dict[str, Cookie]
 
     def __init__(
         self,
@@ -45,19 +77,29 @@ class SecureRequests:
         logExtensive: Optional[bool] = None,
         silent: Optional[bool] = None,
         suppressWarnings: Optional[bool] = None,
-        session: Optional[requests.Session] = None
+        session: Optional[requests.Session] = None,
+        poolConnections: Optional[int] = None,
+        poolMaxsize: Optional[int] = None,
+        stableUA: Optional[bool] = None,
+        sharePools: Optional[bool] = None
     ) -> None: ...
     
-    def _logMessage(self, message: str, level: Union[str, int] = "DEBUG", category: str = "") -> None: ...
+    def _logMessage(self, message: str, level: Union[str, int] = "DEBUG", category: str = "", *args: Any) -> None: ...
     def makeRequest(self, url: str, method: str = "GET", headers: Optional[Dict[str, str]] = None, **kwargs: Any) -> requests.Response: ...
+    def makeRequests(self, calls: List[Union[Tuple[str, str, Optional[Dict[str, str]]], Tuple[str, str, Optional[Dict[str, str]], Dict[str, Any]]]], maxWorkers: int = 8) -> List[requests.Response]: ...
     def _logRequest(self, method: str, url: str, response: requests.Response, **kwargs: Any) -> None: ...
+    def _buildDefaultHeaders(self) -> Dict[str, str]: ...
     def headerGenerate(self, customHeaders: Optional[Dict[str, Any]] = None) -> Dict[str, str]: ...
+    def _mergeCustomHeaders(self, headers: Dict[str, str], customHeaders: Optional[Dict[str, Any]]) -> Dict[str, str]: ...
+    def headerRefresh(self) -> None: ...
     def headerSetKey(self, key: HeaderKeys, value: str) -> None: ...
     def headerRemoveKey(self, key: HeaderKeys) -> None: ...
     def headerUpdateMultiple(self, newHeader: Dict[HeaderKeys, str]) -> None: ...
     def headerRemoveMultiple(self, keys: List[HeaderKeys]) -> None: ...
     def _serializeCookieInfo(self, cookieInfo: Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]) -> str: ...
     def _deserializeCookieInfo(self, cookieInfoStr: str) -> Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]: ...
+    def _cookieInfoFromJar(self, name: str, cookieValue: str) -> Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]: ...
+    def _cookieStore(self, name: str, cookieValue: str) -> None: ...
     def cookieUpdate(self, key: CookieKeys, cookieInfo: Union[str, Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]) -> None: ...
     def cookieGet(self, key: CookieKeys) -> Optional[Dict[Union[CookieAttributeKeys, str], Union[str, bool, int, datetime]]]: ...
     def cookieRemove(self, key: CookieKeys) -> None: ...
@@ -9,6 +9,9 @@ It includes settings for:
 - Logging configurations
 - Suppressing warnings
 - Setting custom certificate paths
+- Sizing the connection pools
+- Keeping a stable browser fingerprint per instance
+- Sharing connection pools between instances
 
 Classes:
 - Config: Manages configuration settings and provides methods to set and get these settings.
@@ -31,7 +34,7 @@ Example:
 """
 import os
 import logging
-from typing import Dict, Union
+from typing import Any, Dict, Union
 
 class Config:
     """
@@ -44,6 +47,7 @@ class Config:
     Methods:
         __init__: Initializes the configuration settings with default values or environment variables.
         __getEnvBool: Retrieve an environment variable and convert it to a boolean.
+        __getEnvInt: Retrieve an environment variable and convert it to an integer.
         setUseTLS: Set the useTLS configuration.
         setUnsafe: Set the unsafe configuration.
         setCertificateNeedFetch: Set the certificateNeedFetch configuration.
@@ -56,6 +60,10 @@ class Config:
         setSilent: Set the silent configuration.
         setSuppressWarnings: Set the suppressWarnings configuration.
         setCertificateVerifyChecksum: Set the certificateVerifyChecksum configuration.
+        setPoolConnections: Set the poolConnections configuration.
+        setPoolMaxsize: Set the poolMaxsize configuration.
+        setStableUA: Set the stableUA configuration.
+        setSharePools: Set the sharePools configuration.
         getUseTLS: Get the useTLS configuration.
         getUnsafe: Get the unsafe configuration.
         getCertificateNeedFetch: Get the certificateNeedFetch configuration.
@@ -68,6 +76,11 @@ class Config:
         getSilent: Get the silent configuration.
         getSuppressWarnings: Get the suppressWarnings configuration.
         getCertificateVerifyChecksum: Get the certificateVerifyChecksum configuration.
+        getPoolConnections: Get the poolConnections configuration.
+        getPoolMaxsize: Get the poolMaxsize configuration.
+        getStableUA: Get the stableUA configuration.
+        getSharePools: Get the sharePools configuration.
+        snapshot: Get all configuration values at once.
     """
     def __init__(self) -> None:
         """
@@ -89,6 +102,10 @@ class Config:
             - logExtensive
             - silent
             - suppressWarnings
+            - poolConnections
+            - poolMaxsize
+            - stableUA
+            - sharePools
         """
         self.useEVar: bool = False  # Default mode is direct configuration
         self.envVars: Dict[str, str] = {
@@ -104,6 +121,10 @@ class Config:
             'logExtensive': 'SECURE_REQUESTS_LOGEXTENSIVE',
             'silent': 'SECURE_REQUESTS_SILENT',
             'suppressWarnings': 'SECURE_REQUESTS_SUPPRESS_WARNINGS',
+            'poolConnections': 'SECURE_REQUESTS_POOL_CONNECTIONS',
+            'poolMaxsize': 'SECURE_REQUESTS_POOL_MAXSIZE',
+            'stableUA': 'SECURE_REQUESTS_STABLE_UA',
+            'sharePools': 'SECURE_REQUESTS_SHARE_POOLS',
         }
 
         self.useTLS: bool = True if not self.useEVar else self.__getEnvBool('useTLS', True)
@@ -118,6 +139,10 @@ class Config:
         self.logExtensive: bool = False if not self.useEVar else self.__getEnvBool('logExtensive', False)
         self.silent: bool = False if not self.useEVar else self.__getEnvBool('silent', False)
         self.suppressWarnings: bool = False if not self.useEVar else self.__getEnvBool('suppressWarnings', False)
+        self.poolConnections: int = 32 if not self.useEVar else self.__getEnvInt('poolConnections', 32)
+        self.poolMaxsize: int = 64 if not self.useEVar else self.__getEnvInt('poolMaxsize', 64)
+        self.stableUA: bool = True if not self.useEVar else self.__getEnvBool('stableUA', True)
+        self.sharePools: bool = False if not self.useEVar else self.__getEnvBool('sharePools', False)
 
     def __getEnvBool(self, key: str, default: bool) -> bool:
         """
@@ -142,6 +167,28 @@ class Config:
         if env_value is None:
             return default
         return env_value.lower() in ('true', '1', 't', 'y', 'yes')
+
+    def __getEnvInt(self, key: str, default: int) -> int:
+        """
+        Retrieve an environment variable and convert it to an integer.
+
+        Args:
+            key (str): The key in the `envVars` dictionary to lookup the environment variable.
+            default (int): The default value to return if the environment variable is not set or not a number.
+
+        Returns:
+            int: The integer value of the environment variable or the default value.
+        """
+        env_key = self.envVars.get(key)
+        if env_key is None:
+            return default
+        env_value = os.getenv(env_key)
+        if env_value is None:
+            return default
+        try:
+            return int(env_value)
+        except ValueError:
+            return default
     
         # Setter methods for direct configuration
     def setUseTLS(self, value: bool): self.useTLS = value
@@ -156,6 +203,10 @@ class Config:
     def setSilent(self, value: bool): self.silent = value
     def setSuppressWarnings(self, value: bool): self.suppressWarnings = value
     def setCertificateVerifyChecksum(self, value: bool): self.certificateVerifyChecksum = value
+    def setPoolConnections(self, value: int): self.poolConnections = value
+    def setPoolMaxsize(self, value: int): self.poolMaxsize = value
+    def setStableUA(self, value: bool): self.stableUA = value
+    def setSharePools(self, value: bool): self.sharePools = value
 
     # Getter methods
     def getUseTLS(self) -> bool: return self.useTLS
@@ -170,5 +221,18 @@ class Config:
     def getSilent(self) -> bool: return self.silent
     def getSuppressWarnings(self) -> bool: return self.suppressWarnings
     def getCertificateVerifyChecksum(self) -> bool: return self.certificateVerifyChecksum
+    def getPoolConnections(self) -> int: return self.poolConnections
+    def getPoolMaxsize(self) -> int: return self.poolMaxsize
+    def getStableUA(self) -> bool: return self.stableUA
+    def getSharePools(self) -> bool: return self.sharePools
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a copy of all configuration values in one call, keyed by attribute name.
+
+        Returns:
+            Dict[str, Any]: The configuration values, e.g. `snapshot()['useTLS']`.
+        """
+        return self.__dict__.copy()
 
 config = Config()
@@ -218,6 +218,9 @@ class HeaderKeys(Serializer, Enum):
     X_XSS_PROTECTION = "X-XSS-Protection"  # Controls browser XSS protection.
     # More info: https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/X-XSS-Protection
 
+# Plain header name for each HeaderKeys member, resolved once at import.
+HEADER_KEY_VALUES = {key: key.value for key in HeaderKeys}
+
 class CookieKeys(Serializer, Enum):
     """
     This enum holds available enumeration keys for standard cookie keys.
@@ -357,6 +360,11 @@ class CookieKeys(Serializer, Enum):
     def __str__(self):
         return self.value
 
+# Plain cookie name for each CookieKeys member, resolved once at import.
+COOKIE_KEY_VALUES = {key: key.value for key in CookieKeys}
+# CookieKeys member for each cookie name, resolved once at import.
+COOKIE_KEY_BY_VALUE = {key.value: key for key in CookieKeys}
+
 class CookieAttributeKeys(Serializer, Enum):
     """
     This enum holds available enumeration keys for cookie attributes used in HTTP headers.
@@ -396,4 +404,9 @@ class CookieAttributeKeys(Serializer, Enum):
     # More info: https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Set-Cookie#extension
 
     def __str__(self):
-        return self.value
\ No newline at end of file
+        return self.value
+
+# Plain attribute name for each CookieAttributeKeys member, resolved once at import.
+COOKIE_ATTRIBUTE_KEY_VALUES = {key: key.value for key in CookieAttributeKeys}
+# CookieAttributeKeys member for each attribute name, resolved once at import.
+COOKIE_ATTRIBUTE_KEY_BY_VALUE = {key.value: key for key in CookieAttributeKeys}
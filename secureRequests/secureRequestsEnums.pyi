@@ -18,6 +18,7 @@ used in web applications.
 
 from enum import Enum
 from datetime import datetime
+from typing import Dict
 
 class HeaderKeys(Enum):
     ACCEPT: str
@@ -81,6 +82,8 @@ class HeaderKeys(Enum):
     X_RATELIMIT_RESET: str
     X_XSS_PROTECTION: str
 
+HEADER_KEY_VALUES: Dict[HeaderKeys, str]
+
 class CookieKeys(Enum):
     SESSION_ID: str
     USER_PREFERENCES: str
@@ -124,6 +127,9 @@ class CookieKeys(Enum):
     USER_ROLE: str
     LOGIN_METHOD: str
 
+COOKIE_KEY_VALUES: Dict[CookieKeys, str]
+COOKIE_KEY_BY_VALUE: Dict[str, CookieKeys]
+
 class CookieAttributeKeys(Enum):
     DOMAIN: str
     PATH: str
@@ -135,4 +141,7 @@ class CookieAttributeKeys(Enum):
     PRIORITY: str
     SAME_PARTY: bool
     PARTITIONED: bool
-    EXTENSION: str
\ No newline at end of file
+    EXTENSION: str
+
+COOKIE_ATTRIBUTE_KEY_VALUES: Dict[CookieAttributeKeys, str]
+COOKIE_ATTRIBUTE_KEY_BY_VALUE: Dict[str, CookieAttributeKeys]
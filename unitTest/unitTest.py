@@ -10,12 +10,23 @@ import logging
 from unittest.mock import patch, MagicMock
 import io
 import traceback
+import ssl
+import certifi
+import requests
+import threading
+import subprocess
+import tempfile
+import warnings
+from datetime import datetime, timedelta, timezone
+from http.server import HTTPServer, BaseHTTPRequestHandler
 
 # Ensure the module can be imported
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from secureRequests import SecureRequests
 from secureRequests.secureRequestsDecorators import STATUS_CODE_EXCEPTION_MAP
+from secureRequests.secureRequests import TLSAdapter
+from urllib3.exceptions import InsecureRequestWarning
 from secureRequests import HeaderKeys, CookieAttributeKeys, CookieKeys
 
 def formatDict(inputDict=None, ignoredKeys=None):
@@ -51,6 +62,69 @@ def formatCookies(cookies):
     
     return "\n".join(formattedCookies)
 
+class StubAdapter(requests.adapters.HTTPAdapter):
+    """Offline adapter that answers every request with 200 and records the prepared requests it was sent."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sent = []
+        self.sentLock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self.sentLock:
+            self.sent.append((request, kwargs))
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+        response._content = b"{}"
+        return response
+
+def mountStubAdapter(srRequest):
+    """Mounts a fresh `StubAdapter` for both schemes on the instance's session and returns it."""
+    adapter = StubAdapter()
+    srRequest.session.mount("https://", adapter)
+    srRequest.session.mount("http://", adapter)
+    return adapter
+
+CERT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'certs')
+# Self-signed certificate for localhost and 127.0.0.1, used as server certificate, CA bundle and client certificate
+LOCALHOST_CERT = os.path.join(CERT_DIR, 'localhost.pem')
+LOCALHOST_KEY = os.path.join(CERT_DIR, 'localhost.key')
+
+class LocalTLSServer:
+    """Local HTTPS server that answers every GET with 200 and records whether the client presented a certificate."""
+    def __init__(self):
+        self.clientCerts = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.clientCerts.append(bool(self.connection.getpeercert()))
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(LOCALHOST_CERT, LOCALHOST_KEY)
+        context.load_verify_locations(cafile=LOCALHOST_CERT)
+        context.verify_mode = ssl.CERT_OPTIONAL
+        self.httpd = HTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.socket = context.wrap_socket(self.httpd.socket, server_side=True)
+        self.url = f"https://localhost:{self.httpd.server_address[1]}/"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
 class CustomTestResult(unittest.TextTestResult):
     """Custom test result class to store additional information about test results."""
     def __init__(self, *args, **kwargs):
@@ -292,6 +366,36 @@ class TestSecureRequests(unittest.TestCase):
             except Exception as e:
                 self.fail(f"[FAIL]{safeStatus} Initialization with certificateNeedFetch: True \nSomething went wrong: {e}")
 
+    def test_certificateFetchCleanup(self):
+        config = self.integrationConfig()[1]
+        with tempfile.TemporaryDirectory() as tempDir:
+            certificatePath = os.path.join(tempDir, "cacert.pem")
+            srRequest = SecureRequests(certificatePath=certificatePath, **config)
+
+            # The download breaks off after the first chunk
+            def brokenStream(chunkSize):
+                yield b"-----BEGIN CERTIFICATE-----"
+                raise requests.exceptions.ChunkedEncodingError("Connection broken")
+            response = MagicMock(status_code=200)
+            response.iter_content.side_effect = brokenStream
+
+            with patch.object(srRequest, 'makeRequest', return_value=response):
+                srRequest._certificateFetch(force=True)
+            self.assertFalse(os.path.exists(f"{certificatePath}.part"))
+            self.assertFalse(os.path.exists(certificatePath))
+            self.assertFalse(srRequest.verify)
+            response.close.assert_called_once()
+            logging.info("[PASS] A failed download leaves no partial certificate behind.")
+
+            # A successful status other than 200 is not saved, but its streamed response is still released
+            response = MagicMock(status_code=203)
+            with patch.object(srRequest, 'makeRequest', return_value=response):
+                srRequest._certificateFetch(force=True)
+            response.iter_content.assert_not_called()
+            response.close.assert_called_once()
+            self.assertFalse(os.path.exists(certificatePath))
+            logging.info("[PASS] A non-200 certificate response is closed.")
+
     def test_HeadersBasicAuth(self):
         """
         Test Basic Authentication Header with https://postman-echo.com/basic-auth.
@@ -359,6 +463,154 @@ class TestSecureRequests(unittest.TestCase):
                 self.assertNotIn(key.value, srRequest.headers)
             logging.info("[PASS] headerRemoveMultiple removed the keys.")
 
+    def test_HeadersSentWithRequest(self):
+        config = self.integrationConfig()[1]
+        with patch('random.choice', side_effect=lambda x: x[0]):
+            srRequest = SecureRequests(**config)
+        adapter = mountStubAdapter(srRequest)
+
+        # Direct writes to the public headers attribute are sent
+        srRequest.headers[HeaderKeys.ORIGIN.value] = "http://example.com"
+        srRequest.makeRequest('https://example.com')
+        sentHeaders = adapter.sent[-1][0].headers
+        self.assertEqual(sentHeaders[HeaderKeys.ORIGIN.value], "http://example.com")
+        self.assertEqual(sentHeaders[HeaderKeys.USER_AGENT.value], self.defaultHeader[HeaderKeys.USER_AGENT.value])
+        logging.info("[PASS] Direct changes to headers are sent.")
+
+        # Per-call headers are merged on top without changing the instance headers
+        srRequest.makeRequest('https://example.com', headers={HeaderKeys.AUTHORIZATION.value: "Bearer token"})
+        self.assertEqual(adapter.sent[-1][0].headers[HeaderKeys.AUTHORIZATION.value], "Bearer token")
+        self.assertNotIn(HeaderKeys.AUTHORIZATION.value, srRequest.headers)
+        logging.info("[PASS] Per-call headers are merged for that request only.")
+
+        # A removed User-Agent falls back to the default one of requests
+        srRequest.headerRemoveKey(HeaderKeys.USER_AGENT)
+        srRequest.makeRequest('https://example.com')
+        self.assertEqual(adapter.sent[-1][0].headers[HeaderKeys.USER_AGENT.value], requests.utils.default_user_agent())
+        logging.info("[PASS] Removed User-Agent falls back to the requests default.")
+
+    def test_makeRequests(self):
+        config = self.integrationConfig()[1]
+        srRequest = SecureRequests(**config)
+        adapter = mountStubAdapter(srRequest)
+        calls = [(f"https://example.com/{index}", "GET", None) for index in range(10)]
+        calls.append(("https://example.com/post", "post", {HeaderKeys.ORIGIN.value: "http://example.com"}, {"json": {"key": "value"}, "timeout": 5}))
+
+        # Responses come back in the order of the calls
+        responses = srRequest.makeRequests(calls, maxWorkers=4)
+        self.assertEqual([response.url for response in responses], [call[0] for call in calls])
+        self.assertEqual(len(adapter.sent), len(calls))
+        logging.info("[PASS] makeRequests returns the responses in call order.")
+
+        # Per-request kwargs and headers reach only their request
+        postRequest, postKwargs = next(sent for sent in adapter.sent if sent[0].method == "POST")
+        self.assertEqual(postRequest.body, b'{"key": "value"}')
+        self.assertEqual(postRequest.headers[HeaderKeys.ORIGIN.value], "http://example.com")
+        self.assertEqual(postKwargs["timeout"], 5)
+        self.assertTrue(all(sent[0].body is None for sent in adapter.sent if sent[0].method == "GET"))
+        logging.info("[PASS] Per-request kwargs and headers are applied.")
+
+        # Invalid worker counts are rejected before any request is made
+        for maxWorkers in (0, -1):
+            with self.assertRaises(ValueError):
+                srRequest.makeRequests(calls, maxWorkers=maxWorkers)
+        self.assertEqual(len(adapter.sent), len(calls))
+        self.assertEqual(srRequest.makeRequests([]), [])
+        logging.info("[PASS] maxWorkers below 1 raises ValueError.")
+
+    def test_HeaderFingerprint(self):
+        config = self.integrationConfig()[1]
+        userAgent = HeaderKeys.USER_AGENT.value
+        with patch('random.choice', side_effect=lambda x: x[0]):
+            srRequest = SecureRequests(stableUA=True, **config)
+        self.assertEqual(srRequest.headers, self.defaultHeader)
+        adapter = mountStubAdapter(srRequest)
+
+        # headerGenerate rolls a new fingerprint on every call, stableUA only concerns the instance headers
+        with patch('random.choice', side_effect=lambda x: x[-1]):
+            generated = srRequest.headerGenerate({HeaderKeys.ORIGIN.value: "http://example.com"})
+        self.assertNotEqual(generated[userAgent], self.defaultHeader[userAgent])
+        self.assertEqual(generated[HeaderKeys.ORIGIN.value], "http://example.com")
+        self.assertGreater(len({srRequest.headerGenerate()[userAgent] for _ in range(50)}), 1)
+        logging.info("[PASS] headerGenerate randomizes regardless of stableUA.")
+
+        # With stableUA every request sends the instance's fingerprint
+        with patch('random.choice', side_effect=lambda x: x[-1]):
+            srRequest.makeRequest('https://example.com')
+        self.assertEqual(adapter.sent[-1][0].headers[userAgent], self.defaultHeader[userAgent])
+        logging.info("[PASS] stableUA keeps the fingerprint across requests.")
+
+        # headerRefresh replaces only the fingerprint headers still present on the instance
+        srRequest.headerRemoveKey(HeaderKeys.SEC_CH_UA_PLATFORM)
+        srRequest.headerSetKey(HeaderKeys.ACCEPT, "application/json")
+        with patch('random.choice', side_effect=lambda x: x[-1]):
+            srRequest.headerRefresh()
+        self.assertNotEqual(srRequest.headers[userAgent], self.defaultHeader[userAgent])
+        self.assertEqual(srRequest.headers[userAgent], srRequest._defaultHeaders[userAgent])
+        self.assertEqual(srRequest.headers[HeaderKeys.SEC_CH_UA.value], srRequest._defaultHeaders[HeaderKeys.SEC_CH_UA.value])
+        self.assertNotIn(HeaderKeys.SEC_CH_UA_PLATFORM.value, srRequest.headers)
+        self.assertEqual(srRequest.headers[HeaderKeys.ACCEPT.value], "application/json")
+        logging.info("[PASS] headerRefresh rolls the fingerprint and keeps other changes.")
+
+        # Without stableUA every request rolls its own fingerprint, headers changed on the instance are kept
+        srRequest.stableUA = False
+        refreshedAgent = srRequest.headers[userAgent]
+        with patch('random.choice', side_effect=lambda x: x[0]):
+            srRequest.makeRequest('https://example.com')
+        self.assertEqual(adapter.sent[-1][0].headers[userAgent], self.defaultHeader[userAgent])
+        self.assertEqual(srRequest.headers[userAgent], refreshedAgent)
+        srRequest.headerSetKey(HeaderKeys.USER_AGENT, "CustomAgent/1.0")
+        with patch('random.choice', side_effect=lambda x: x[0]):
+            srRequest.makeRequest('https://example.com')
+        self.assertEqual(adapter.sent[-1][0].headers[userAgent], "CustomAgent/1.0")
+        logging.info("[PASS] Without stableUA requests roll a fingerprint unless it was changed.")
+
+    def test_HTTPMethodsCaseInsensitive(self):
+        config = self.integrationConfig()[1]
+        srRequest = SecureRequests(**config)
+        adapter = mountStubAdapter(srRequest)
+
+        for method in self.methods:
+            srRequest.makeRequest('https://example.com', method=method)
+            self.assertEqual(adapter.sent[-1][0].method, method.upper())
+        logging.info("[PASS] Lowercase HTTP methods are sent uppercased.")
+
+        with self.assertRaises(ValueError):
+            srRequest.makeRequest('https://example.com', method='fetch')
+        self.assertEqual(len(adapter.sent), len(self.methods))
+        logging.info("[PASS] Unsupported HTTP methods raise ValueError.")
+
+    def test_CookieAttributeParsing(self):
+        config = self.integrationConfig()[1]
+        srRequest = SecureRequests(**config)
+        expires = datetime(2024, 7, 15, 12, 0, 0)
+        cookieInfo = {
+            CookieAttributeKeys.DOMAIN: "example.com",
+            CookieAttributeKeys.EXPIRES: expires,
+            CookieAttributeKeys.SECURE: True,
+            CookieAttributeKeys.HTTP_ONLY: False,
+            CookieAttributeKeys.MAX_AGE: 3600,
+            "custom": "value"
+        }
+
+        # Bool, int and datetime attributes come back with their types, unknown names stay strings
+        srRequest.cookieUpdate(CookieKeys.SESSION_ID, cookieInfo)
+        parsed = srRequest._deserializeCookieInfo(srRequest._serializeCookieInfo(cookieInfo))
+        self.assertEqual(parsed, cookieInfo)
+        self.assertIs(parsed[CookieAttributeKeys.SECURE], True)
+        self.assertIs(parsed[CookieAttributeKeys.HTTP_ONLY], False)
+        self.assertEqual(srRequest.cookieGet(CookieKeys.SESSION_ID), cookieInfo)
+        logging.info("[PASS] Cookie attributes round-trip with their types.")
+
+        # Values that do not match the attribute type are kept as strings, items without '=' are skipped
+        parsed = srRequest._deserializeCookieInfo("max_age=soon|secure=yes|expires=tomorrow|invalid")
+        self.assertEqual(parsed, {
+            CookieAttributeKeys.MAX_AGE: "soon",
+            CookieAttributeKeys.SECURE: "yes",
+            CookieAttributeKeys.EXPIRES: "tomorrow"
+        })
+        logging.info("[PASS] Unparsable attribute values stay strings.")
+
     def test_CookiesLogics(self):
         config = self.integrationConfig()[0]
         with patch('random.choice', side_effect=lambda x: x[0]):
@@ -407,5 +659,166 @@ class TestSecureRequests(unittest.TestCase):
                 self.assertEqual(srRequest.session.cookies.get(key.value), expected_value)
             logging.info("[PASS] cookieUpdateMultiple added multiple cookies.")
 
+    def test_CookieCacheConsistency(self):
+        config = self.integrationConfig()[1]
+        srRequest = SecureRequests(**config)
+        cookieInfo = {
+            CookieAttributeKeys.DOMAIN.value: "example.com",
+            CookieAttributeKeys.SECURE: True,
+            CookieAttributeKeys.MAX_AGE: 3600
+        }
+        srRequest.cookieUpdate(CookieKeys.SESSION_ID, cookieInfo)
+
+        # First read parses the jar value, the second one is served from the cache
+        firstRead = srRequest.cookieGet(CookieKeys.SESSION_ID)
+        secondRead = srRequest.cookieGet(CookieKeys.SESSION_ID)
+        parsed = srRequest._deserializeCookieInfo(srRequest.session.cookies.get(CookieKeys.SESSION_ID.value))
+        self.assertEqual(firstRead, parsed)
+        self.assertEqual(secondRead, parsed)
+        self.assertEqual(secondRead[CookieAttributeKeys.DOMAIN], "example.com")
+        self.assertIs(secondRead[CookieAttributeKeys.SECURE], True)
+        self.assertEqual(secondRead[CookieAttributeKeys.MAX_AGE], 3600)
+        logging.info("[PASS] Cached and parsed cookie attributes match in keys and types.")
+
+        # Returned dictionaries are copies, changing them does not reach the cache
+        secondRead[CookieAttributeKeys.SECURE] = False
+        self.assertIs(srRequest.cookieGet(CookieKeys.SESSION_ID)[CookieAttributeKeys.SECURE], True)
+
+        # cookieUpdateMultiple stores the same normalized form
+        srRequest.cookieUpdateMultiple({CookieKeys.USER_ID: cookieInfo})
+        self.assertEqual(srRequest.cookieGet(CookieKeys.USER_ID), parsed)
+        self.assertEqual(srRequest.cookieGetAll()[CookieKeys.USER_ID], parsed)
+        logging.info("[PASS] cookieUpdateMultiple and cookieGetAll return the normalized attributes.")
+
+        # Values that compare equal but print differently are stored as they print
+        utcExpires = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        cetExpires = datetime(2024, 1, 1, 13, 0, tzinfo=timezone(timedelta(hours=1)))
+        srRequest.cookieUpdate(CookieKeys.SESSION_ID, {CookieAttributeKeys.EXPIRES: utcExpires})
+        srRequest.cookieUpdate(CookieKeys.SESSION_ID, {CookieAttributeKeys.EXPIRES: cetExpires})
+        self.assertEqual(srRequest.session.cookies.get(CookieKeys.SESSION_ID.value), f"expires={cetExpires}")
+        logging.info("[PASS] Equal attribute values with different text are serialized as written.")
+
+        # Changes made directly on the session's jar are seen by the next cookieGetAll
+        srRequest.cookieGetAll()
+        srRequest.session.cookies.set(CookieKeys.CSRF_TOKEN.value, "domain=example.com")
+        del srRequest.session.cookies[CookieKeys.USER_ID.value]
+        allCookies = srRequest.cookieGetAll()
+        self.assertEqual(allCookies[CookieKeys.CSRF_TOKEN], {CookieAttributeKeys.DOMAIN: "example.com"})
+        self.assertNotIn(CookieKeys.USER_ID, allCookies)
+        logging.info("[PASS] cookieGetAll reflects direct changes to the jar.")
+
+    def test_LazyPackageExports(self):
+        # Run in a fresh interpreter, this process has already imported every module
+        probe = (
+            "import sys, secureRequests\n"
+            "assert 'secureRequests.secureRequests' not in sys.modules\n"
+            "from secureRequests import HeaderKeys\n"
+            "assert 'secureRequests.secureRequests' not in sys.modules\n"
+            "from secureRequests import SecureRequests, srExceptions\n"
+            "assert SecureRequests is sys.modules['secureRequests.secureRequests'].SecureRequests\n"
+            "assert srExceptions is sys.modules['secureRequests.secureRequestsExceptions']\n"
+            "assert set(secureRequests.__all__) <= set(dir(secureRequests))\n"
+        )
+        packageRoot = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        result = subprocess.run([sys.executable, "-c", probe], cwd=packageRoot, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        with self.assertRaises(AttributeError):
+            import secureRequests
+            secureRequests.doesNotExist
+        logging.info("[PASS] Package components are imported on first access.")
+
+    def test_TLSAdapterContexts(self):
+        request = requests.Request('GET', 'https://example.com').prepare()
+
+        # A CA bundle is loaded once into a shared context that trusts only the bundle
+        _, poolKwargs = TLSAdapter().build_connection_pool_key_attributes(request, certifi.where())
+        bundleContext = poolKwargs['ssl_context']
+        expectedContext = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        expectedContext.load_verify_locations(cafile=certifi.where())
+        self.assertEqual(bundleContext.cert_store_stats(), expectedContext.cert_store_stats())
+        _, poolKwargs = TLSAdapter().build_connection_pool_key_attributes(request, certifi.where())
+        self.assertIs(poolKwargs['ssl_context'], bundleContext)
+        _, poolKwargs = TLSAdapter().build_connection_pool_key_attributes(request, False)
+        self.assertNotIn('ssl_context', poolKwargs)
+        logging.info("[PASS] CA bundles get a cached context, verify=False keeps urllib3's default.")
+
+        with LocalTLSServer() as serverA, LocalTLSServer() as serverB:
+            session = requests.Session()
+            session.mount("https://", TLSAdapter())
+            self.assertEqual(session.get(serverA.url, verify=LOCALHOST_CERT).status_code, 200)
+            with self.assertRaises(requests.exceptions.SSLError):
+                session.get(serverA.url, verify=True)
+            logging.info("[PASS] The bundle context trusts the bundle, the default one does not.")
+
+            # New connections on a shared context do not load the bundle into it again
+            sharedContext = TLSAdapter._sharedSSLContexts[LOCALHOST_CERT]
+            session.close()
+            with patch.object(ssl.SSLContext, 'load_verify_locations', autospec=True) as loadMock:
+                session.get(serverA.url, verify=LOCALHOST_CERT)
+            self.assertFalse([call for call in loadMock.call_args_list if call.args[0] is sharedContext])
+            logging.info("[PASS] urllib3 does not reload the bundle into the shared context.")
+
+            # A client certificate is never loaded into a shared context, so later connections do not present it
+            session.get(serverA.url, verify=LOCALHOST_CERT, cert=(LOCALHOST_CERT, LOCALHOST_KEY))
+            otherSession = requests.Session()
+            otherSession.mount("https://", TLSAdapter())
+            otherSession.get(serverB.url, verify=LOCALHOST_CERT)
+            session.get(serverB.url, verify=LOCALHOST_CERT)
+            self.assertEqual(serverA.clientCerts, [False, False, True])
+            self.assertEqual(serverB.clientCerts, [False, False])
+            session.close()
+            otherSession.close()
+            logging.info("[PASS] A client certificate is only presented on its own request.")
+
+    def test_SuppressWarnings(self):
+        config = dict(self.integrationConfig()[1], suppressWarnings=True)
+        isSuppressed = lambda: any(action == "ignore" and category is InsecureRequestWarning for action, _, category, _, _ in warnings.filters)
+
+        with warnings.catch_warnings():
+            warnings.resetwarnings()
+            # The filter of an instance created inside a catch_warnings block is gone after it
+            with warnings.catch_warnings():
+                SecureRequests(**config)
+                self.assertTrue(isSuppressed())
+            self.assertFalse(isSuppressed())
+
+            # Later instances install it again
+            SecureRequests(**config)
+            self.assertTrue(isSuppressed())
+        logging.info("[PASS] Every suppressWarnings instance installs the warning filter.")
+
+    def test_SharePools(self):
+        config = self.integrationConfig()[1]
+
+        # Off by default, every instance mounts adapters of its own
+        first, second = SecureRequests(**config), SecureRequests(**config)
+        self.assertIsNot(first.session.get_adapter('https://example.com'), second.session.get_adapter('https://example.com'))
+        logging.info("[PASS] Pools are not shared by default.")
+
+        # Shared adapters survive closing one of the sessions using them
+        first, second = SecureRequests(sharePools=True, **config), SecureRequests(sharePools=True, **config)
+        sharedAdapter = first.session.get_adapter('https://example.com')
+        self.assertIs(sharedAdapter, second.session.get_adapter('https://example.com'))
+        connectionPool = sharedAdapter.get_connection_with_tls_context(requests.Request('GET', 'https://example.com').prepare(), False)
+        first.session.close()
+        self.assertIs(sharedAdapter.get_connection_with_tls_context(requests.Request('GET', 'https://example.com').prepare(), False), connectionPool)
+        logging.info("[PASS] Closing a session leaves the shared pools open.")
+
+        # A passed session keeps its own adapters, only TLS replaces the HTTPS one
+        retryAdapter = requests.adapters.HTTPAdapter(max_retries=5)
+        callerSession = requests.Session()
+        callerSession.mount("https://", retryAdapter)
+        callerSession.mount("http://", retryAdapter)
+        third = SecureRequests(session=callerSession, sharePools=True, poolMaxsize=32, **config)
+        self.assertIs(third.session.get_adapter('https://example.com'), retryAdapter)
+        self.assertIs(third.session.get_adapter('http://example.com'), retryAdapter)
+        self.assertEqual(retryAdapter.max_retries.total, 5)
+        tlsConfig = dict(config, unsafe=False, useTLS=True)
+        fourth = SecureRequests(session=callerSession, sharePools=True, **tlsConfig)
+        self.assertIsInstance(fourth.session.get_adapter('https://example.com'), TLSAdapter)
+        self.assertIsNot(fourth.session.get_adapter('https://example.com'), sharedAdapter)
+        self.assertIs(fourth.session.get_adapter('http://example.com'), retryAdapter)
+        logging.info("[PASS] A passed session keeps its adapters apart from the TLS one.")
+
 if __name__ == "__main__":
     unittest.main(testRunner=CustomTestRunner())
\ No newline at end of file